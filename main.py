@@ -1,4 +1,6 @@
 """NApp that solve the L2 Learning Switch algorithm."""
+import json
+
 import requests
 from kytos.core import KytosEvent, KytosNApp, log
 from kytos.core.helpers import listen_to
@@ -12,6 +14,64 @@ from pyof.v0x04.common.port import PortNo as Port13
 from pyof.v0x04.controller2switch.packet_out import PacketOut as PacketOut13
 
 
+def _pack_mac(mac):
+    """Pack an 'aa:bb:cc:dd:ee:ff' string into its raw 6-byte form."""
+    return bytes(int(byte, 16) for byte in mac.split(':'))
+
+
+# LLDP MAC addresses in raw wire format, so the PacketIn hot path filters
+# LLDP frames straight from the packet bytes with a single hash lookup,
+# before paying for the Ethernet unpack.
+_LLDP_MACS = frozenset(_pack_mac(mac) for mac in settings.LLDP_MACS)
+
+# Name of the outgoing PacketOut event, interned once at import.
+_PACKET_OUT_EVENT = 'kytos/of_l2ls.messages.out.ofpt_packet_out'
+
+# Headers for requests whose body is serialized beforehand.
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Enum members resolved once at import, off the per-packet paths.
+_OFPR_NO_MATCH = PacketInReason.OFPR_NO_MATCH
+_OFPP_FLOOD = Port13.OFPP_FLOOD
+_OFPPC_NO_FWD = PortConfig13.OFPPC_NO_FWD
+
+
+class OFPayload:
+    """Slotted stand-in for the event content dict.
+
+    It holds the same keys the handlers used to store in the ``content``
+    dict, without allocating a dict per emitted event. Item access is kept
+    so consumers that index the event content keep working.
+    """
+
+    __slots__ = ('message', 'destination', 'source')
+
+    def __init__(self, message=None, destination=None, source=None):
+        """Store the payload attributes."""
+        self.message = message
+        self.destination = destination
+        self.source = source
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __setitem__(self, key, value):
+        try:
+            setattr(self, key, value)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key):
+        return hasattr(self, key)
+
+    def get(self, key, default=None):
+        """Mimic ``dict.get`` for backward compatibility."""
+        return getattr(self, key, default)
+
+
 class Main(KytosNApp):
     """Main class of a KytosNApp, responsible for OpenFlow operations."""
 
@@ -21,6 +81,29 @@ class Main(KytosNApp):
         The setup method is automatically called by the run method.
         Users shouldn't call this method directly.
         """
+        # The table-miss flow is the same for every switch, so it is built
+        # and serialized only once.
+        flow = {}
+        flow['priority'] = 0
+        flow['table_id'] = settings.TABLE_ID
+        flow['actions'] = [{'action_type': 'output',
+                            'port': Port13.OFPP_CONTROLLER}]
+        self._table_miss_payload = json.dumps({'flows': [flow]})
+        # The flood action is constant and only read after being enqueued,
+        # so one shared instance serves every flooded PacketOut.
+        self._flood_action = Output13(port=_OFPP_FLOOD)
+        # Endpoint prefix resolved once; only the switch id varies per
+        # request.
+        self._flows_url = f'{settings.FLOW_MANAGER_URL}/flows/'
+        # Settings used per PacketIn, resolved once at startup.
+        self._flow_priority = settings.FLOW_PRIORITY
+        self._table_id = settings.TABLE_ID
+        # Reuse one HTTP session (and its connection pool) for every
+        # flow_manager request instead of opening a connection per POST.
+        self._session = requests.Session()
+        # Bound method kept as an attribute to skip the
+        # controller -> buffers -> msg_out -> put lookup chain per packet.
+        self._msg_out_put = self.controller.buffers.msg_out.put
 
     def execute(self):
         """Run once on app 'start' or in a loop.
@@ -42,30 +125,24 @@ class Main(KytosNApp):
             version = switch.connection.protocol.version
         except AttributeError:
             version = None
-            log.debug(f'The OpenFlow version was not found for switch {dpid}.')
+            log.debug('The OpenFlow version was not found for switch %s.',
+                      dpid)
 
         if version != 0x04:
             return
 
-        flow = {}
-        flow['priority'] = 0
-        flow['table_id'] = settings.TABLE_ID
-        flow['actions'] = [{'action_type': 'output',
-                            'port': Port13.OFPP_CONTROLLER}]
-
         destination = switch.id
-        endpoint = f'{settings.FLOW_MANAGER_URL}/flows/{destination}'
-        data = {'flows': [flow]}
+        endpoint = f'{self._flows_url}{destination}'
         # pylint: disable=missing-timeout
-        requests.post(endpoint, json=data)
+        self._session.post(endpoint, data=self._table_miss_payload,
+                           headers=_JSON_HEADERS)
 
-    @staticmethod
-    def _create_flow(packet, port):
+    def _create_flow(self, packet, port):
         """Create a Flow message."""
         flow = {}
         match = {}
-        flow['priority'] = settings.FLOW_PRIORITY
-        flow['table_id'] = settings.TABLE_ID
+        flow['priority'] = self._flow_priority
+        flow['table_id'] = self._table_id
 
         match['dl_src'] = packet.source.value
         match['dl_dst'] = packet.destination.value
@@ -78,20 +155,22 @@ class Main(KytosNApp):
 
         return flow
 
-    @staticmethod
-    def _create_packet_out(version, packet, ports, switch):
+    def _create_packet_out(self, version, packet, ports, switch):
         """Create a PacketOut message with the appropriate version and data."""
         if version == '0x04':
-            port = ports[0] if ports else Port13.OFPP_FLOOD
+            port = ports[0] if ports else _OFPP_FLOOD
 
             iface = switch.get_interface_by_port_no(port)
 
-            if iface and (iface.config & PortConfig13.OFPPC_NO_FWD ==
-                          PortConfig13.OFPPC_NO_FWD):
+            if iface and iface.config & _OFPPC_NO_FWD == _OFPPC_NO_FWD:
                 return None
 
             packet_out = PacketOut13()
-            packet_out.actions.append(Output13(port=port))
+            if ports:
+                action = Output13(port=port)
+            else:
+                action = self._flood_action
+            packet_out.actions.append(action)
 
         packet_out.buffer_id = packet.buffer_id
         packet_out.in_port = packet.in_port
@@ -108,19 +187,25 @@ class Main(KytosNApp):
         Args:
             event (KytosPacketIn): Received Event
         """
-        log.debug("PacketIn Received")
-
         packet_in = event.content['message']
 
-        ethernet = Ethernet()
-        ethernet.unpack(packet_in.data.value)
+        # Ignore packets not generated by table-miss flows before touching
+        # the payload at all
+        if packet_in.reason != _OFPR_NO_MATCH:
+            return
+
+        data = packet_in.data.value
 
-        # Ignore LLDP packets or packets not generated by table-miss flows
-        if (ethernet.destination in settings.LLDP_MACS or
-                packet_in.reason != PacketInReason.OFPR_NO_MATCH):
+        # Ignore LLDP packets (filtered on the raw destination bytes, so no
+        # Ethernet unpack is paid for them)
+        if data[:6] in _LLDP_MACS:
             return
 
-        switch = event.source.switch
+        ethernet = Ethernet()
+        ethernet.unpack(data)
+
+        source = event.source
+        switch = source.switch
         version = switch.ofp_version
 
         # Learn the port where the sender is connected
@@ -134,10 +219,10 @@ class Main(KytosNApp):
         if ports:
             flow = self._create_flow(ethernet, ports[0])
             destination = switch.id
-            endpoint = f'{settings.FLOW_MANAGER_URL}/flows/{destination}'
+            endpoint = f'{self._flows_url}{destination}'
             data = {'flows': [flow]}
             # pylint: disable=missing-timeout
-            requests.post(endpoint, json=data)
+            self._session.post(endpoint, json=data)
 
         # Send the packet to correct destination or flood it
         packet_out = self._create_packet_out(version, packet_in, ports, switch)
@@ -145,12 +230,12 @@ class Main(KytosNApp):
         if packet_out is None:
             return
 
-        event_out = KytosEvent(name=('kytos/of_l2ls.messages.out.'
-                                     'ofpt_packet_out'),
-                               content={'destination': event.source,
-                                        'message': packet_out})
+        event_out = KytosEvent(name=_PACKET_OUT_EVENT,
+                               content=OFPayload(message=packet_out,
+                                                 destination=source))
 
-        self.controller.buffers.msg_out.put(event_out)
+        self._msg_out_put(event_out)
 
     def shutdown(self):
-        """Too simple to have a shutdown procedure."""
+        """Close the HTTP session kept for flow_manager requests."""
+        self._session.close()
@@ -1,6 +1,7 @@
 """Test Main methods."""
+import json
 from unittest import TestCase
-from unittest.mock import MagicMock, call, patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 from kytos.lib.helpers import (get_controller_mock, get_kytos_event_mock,
@@ -22,19 +23,23 @@ class TestMain(TestCase):
         self.napp = Main(get_controller_mock())
 
     @patch('napps.kytos.of_l2ls.main.Port13')
-    @patch('napps.kytos.of_l2ls.main.requests')
     @patch('napps.kytos.of_l2ls.main.settings')
     @patch('kytos.core.controller.Controller.get_switch_by_dpid')
     def test_install_table_miss_flow(self, *args):
         """Test _create_flow_mod method for flow 1.3 packet."""
-        (mock_get_switch_by_dpid, mock_settings, mock_requests,
-         mock_port13) = args
+        (mock_get_switch_by_dpid, mock_settings, mock_port13) = args
 
         mock_port13.OFPP_CONTROLLER = 123
         flow_manager_url = 'http://localhost:8181/api/kytos/flow_manager/v2'
 
         mock_settings.FLOW_MANAGER_URL = flow_manager_url
         mock_settings.TABLE_ID = 0
+
+        # Rebuild the payloads cached by setup with the patches active.
+        self.napp.setup()
+
+        mock_session = MagicMock()
+        self.napp._session = mock_session
         expected_flow = {}
         expected_flow['priority'] = 0
         expected_flow['table_id'] = 0
@@ -52,11 +57,26 @@ class TestMain(TestCase):
                                      content={'dpid': dpid})
         self.napp.install_table_miss_flow(event)
 
-        data = {'flows': [expected_flow]}
-        mock_requests.post.assert_called_with(endpoint, json=data)
+        data = json.dumps({'flows': [expected_flow]})
+        headers = {'Content-Type': 'application/json'}
+        mock_session.post.assert_called_with(endpoint, data=data,
+                                             headers=headers)
 
-    @patch('napps.kytos.of_l2ls.main.settings')
-    def test_create_flow(self, mock_settings):
+    def test_of_payload(self):
+        """Test dict-style access to OFPayload."""
+        # pylint: disable=import-outside-toplevel
+        from napps.kytos.of_l2ls.main import OFPayload
+
+        payload = OFPayload(message='msg', destination='dst')
+
+        self.assertEqual(payload['message'], 'msg')
+        self.assertEqual(payload.get('destination'), 'dst')
+        self.assertIsNone(payload.get('binary_data'))
+        self.assertIn('message', payload)
+        with self.assertRaises(KeyError):
+            payload['unknown']  # pylint: disable=pointless-statement
+
+    def test_create_flow(self):
         """Test _create_flow method."""
 
         expected_flow = {}
@@ -72,8 +92,8 @@ class TestMain(TestCase):
         expected_flow['match'] = match
         expected_flow['actions'] = [{'action_type': 'output',
                                      'port': 123}]
-        mock_settings.FLOW_PRIORITY = 10
-        mock_settings.TABLE_ID = 0
+        self.napp._flow_priority = 10
+        self.napp._table_id = 0
 
         packet = MagicMock()
         packet.source.value = '00:00:00:00:00:00:00:01'
@@ -98,6 +118,9 @@ class TestMain(TestCase):
         mock_packet_out.return_value = packet_out
         mock_action.return_value = action
 
+        # Rebuild the shared flood action with Output13 patched.
+        self.napp.setup()
+
         packet = MagicMock()
         packet.buffer_id = 2
         packet.in_port = 2
@@ -130,12 +153,17 @@ class TestMain(TestCase):
     @patch('napps.kytos.of_l2ls.main.Main._create_flow')
     @patch('napps.kytos.of_l2ls.main.KytosEvent')
     @patch('napps.kytos.of_l2ls.main.Ethernet')
-    @patch('napps.kytos.of_l2ls.main.requests')
     def test_handle_packet_in(self, *args):
         """Test handle_packet_in method."""
-        (mock_requests, mock_ethernet, mock_kytos_event, mock_create_flow,
+        (mock_ethernet, mock_kytos_event, mock_create_flow,
          mock_create_packet_out, mock_buffer_put) = args
 
+        # Rebind the bound methods cached by setup with the patches active.
+        self.napp.setup()
+
+        mock_session = MagicMock()
+        self.napp._session = mock_session
+
         ethernet = MagicMock()
         mock_ethernet.return_value = ethernet
 
@@ -165,11 +193,11 @@ class TestMain(TestCase):
         mock_create_packet_out.assert_called_with(switch.ofp_version,
                                                   message, ports, switch)
 
-        event_call = [call(name='kytos/of_l2ls.messages.out.ofpt_packet_out',
-                           content={'destination': event.source,
-                                    'message': packet_out})]
-
-        mock_kytos_event.assert_has_calls(event_call)
+        event_kwargs = mock_kytos_event.call_args.kwargs
+        self.assertEqual(event_kwargs['name'],
+                         'kytos/of_l2ls.messages.out.ofpt_packet_out')
+        self.assertEqual(event_kwargs['content']['message'], packet_out)
+        self.assertEqual(event_kwargs['content']['destination'], event.source)
 
-        self.assertEqual(mock_requests.post.call_count, 1)
+        self.assertEqual(mock_session.post.call_count, 1)
         self.assertEqual(mock_buffer_put.call_count, 1)